@@ -1 +1 @@
-from .scraper import ScraperWg
\ No newline at end of file
+from .scraper import ScraperWg, scrape_many
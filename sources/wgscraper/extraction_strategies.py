@@ -4,8 +4,21 @@ import re
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 
-    
+# Matches the numeric part of direction titles like "NNW (337°)". Keying on
+# the opening parenthesis keeps it robust to how the degree sign is encoded.
+_ANGLE_RE = re.compile(r'\((-?\d+)')
+
+
 class ExtractionStrategy(ABC):
+    # Superset of the attributes used across subclasses; avoids a per-instance
+    # __dict__ and makes attribute access a fixed-offset read.
+    __slots__ = ('config_item', 'logger', '_pattern', '_group_names',
+                 '_param', '_param_needle', '_span_xpath', '_threshold')
+
+    # Which branch of the scraper's table-collection script produces this
+    # strategy's raw payload ('text', 'titles', 'divs' or 'svg').
+    js_method = 'text'
+
     def __init__(self, config_item, logger):
         self.config_item = config_item
         self.logger = logger
@@ -14,134 +27,272 @@ class ExtractionStrategy(ABC):
     def extract(self, cells: list[WebElement]) -> list:
         pass
 
+    def js_args(self) -> dict | None:
+        """Extra per-column arguments for the table-collection script."""
+        return None
+
+    def parse_payload(self, payload: list) -> list:
+        """Converts the raw in-browser payload into extracted values."""
+        return payload
+
 
 class ExtractionStrategyFactory:
+    # Shared registry, populated by the @register decorator on each strategy
+    # class so the mapping is not rebuilt per factory instance.
+    strategies: dict[str, type] = {}
+
     def __init__(self, logger):
         self.logger = logger
-        self.strategies = {
-            'numeric_content': NumericContentStrategy,
-            'text_content': TextContentStrategy,
-            'angle_title_attribute': AngleTitleAttributeStrategy,
-            'multi_div_text': MultiDivTextStrategy,
-            'regex': RegexContentStrategy,
-            'tide_combined': TideCombinedStrategy
-        }
+        # Memoizes strategy instances per (method, config item) so the work
+        # done in their __init__ (precompiled regexes, cached config reads)
+        # survives across scrapes.
+        self._instances = {}
+
+    @classmethod
+    def register(cls, method_name: str):
+        def decorator(strategy_class):
+            cls.strategies[method_name] = strategy_class
+            return strategy_class
+        return decorator
 
     def get_strategy(self, method_name: str, config_item: dict) -> ExtractionStrategy | None:
+        key = (method_name, id(config_item))
+        strategy = self._instances.get(key)
+        if strategy is not None:
+            return strategy
         strategy_class = self.strategies.get(method_name)
         if strategy_class:
-            return strategy_class(config_item, self.logger)
-        self.logger.warning(f"No extraction strategy found for method: {method_name}")
+            strategy = strategy_class(config_item, self.logger)
+            self._instances[key] = strategy
+            return strategy
+        self.logger.warning("No extraction strategy found for method: %s", method_name)
         return None
-    
 
+
+def _bulk_text_content(cells: list[WebElement]) -> list[str]:
+    """Fetches the trimmed rendered text of all cells in a single execute_script call.
+
+    innerText (not textContent) preserves Selenium's .text semantics: it
+    inserts newlines at line-break boundaries, which the date cells rely on
+    ("Sa\\n5.\\n08h").
+    """
+    if not cells:
+        return []
+    driver = cells[0].parent
+    return driver.execute_script(
+        "return arguments[0].map(e => e.innerText.trim());", cells
+    )
+
+
+@ExtractionStrategyFactory.register('numeric_content')
 class NumericContentStrategy(ExtractionStrategy):
+    __slots__ = ()
+
     def extract(self, cells: list[WebElement]) -> list:
-        return [
-            float(cell.text.strip()) if cell.text.strip() else None
-            for cell in cells
-        ]
+        return self.parse_payload(_bulk_text_content(cells))
+
+    def parse_payload(self, payload: list) -> list:
+        return [float(text) if text else None for text in payload]
 
 
+@ExtractionStrategyFactory.register('text_content')
 class TextContentStrategy(ExtractionStrategy):
+    __slots__ = ()
+
     def extract(self, cells: list[WebElement]) -> list:
-        return [cell.text.strip() for cell in cells]
+        return _bulk_text_content(cells)
 
 
+@ExtractionStrategyFactory.register('angle_title_attribute')
 class AngleTitleAttributeStrategy(ExtractionStrategy):
+    __slots__ = ()
+
+    js_method = 'titles'
+
+    # Runs in-browser over all cells at once: filters on the data-x param and
+    # returns the title of the span located by the configured XPath (or null)
+    # per cell.
+    _TITLES_JS = """
+        const param = arguments[1];
+        const needle = arguments[2];
+        const spanXpath = arguments[3];
+        return arguments[0].map(function (el) {
+            const dataX = el.getAttribute('data-x');
+            if (!dataX) { return null; }
+            // Cheap substring check first; fall back to a full JSON parse
+            // only when the needle is absent (e.g. different spacing).
+            if (dataX.indexOf(needle) === -1) {
+                try {
+                    if (JSON.parse(dataX).param !== param) { return null; }
+                } catch (e) {
+                    return null;
+                }
+            }
+            const span = document.evaluate(
+                spanXpath, el, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            return span ? span.getAttribute('title') : null;
+        });
+    """
+
+    def __init__(self, config_item, logger):
+        super().__init__(config_item, logger)
+        self._param = config_item.get('param')
+        self._param_needle = f'"param":"{self._param}"' if self._param else None
+        self._span_xpath = config_item.get('span_xpath', ".//span[@title]")
+
     def extract(self, cells: list[WebElement]) -> list:
-        param_value = self.config_item.get('param')
-        span_xpath = self.config_item.get('span_xpath', ".//span[@title]")
-        extracted_data = []
-        if param_value:
-            for cell in cells:
-                data_x = cell.get_attribute("data-x")
-                angle = None
-                if data_x:
-                    try:
-                        data_x_json = json.loads(data_x)
-                        param = data_x_json.get("param")
-                        if param == param_value:
-                            try:
-                                span_element = cell.find_element(By.XPATH, span_xpath)
-                                title_attribute = span_element.get_attribute("title")
-                                if title_attribute:
-                                    angle = int(title_attribute.split('(')[1].split('°)')[0])
-                            except Exception as e:
-                                self.logger.warning(f"Error extracting angle from title: {e}")
-                    except json.JSONDecodeError:
-                        self.logger.warning(f"Error decoding data-x attribute: {data_x}")
-                extracted_data.append(angle)
-        else:
-            self.logger.warning(f"Missing 'param' in config for angle extraction.")
-        return extracted_data
+        if not self._param:
+            self.logger.warning("Missing 'param' in config for angle extraction.")
+            return []
+        if not cells:
+            return []
+        # One execute_script round-trip for the whole column instead of
+        # several WebDriver calls per cell.
+        driver = cells[0].parent
+        titles = driver.execute_script(
+            self._TITLES_JS, cells, self._param, self._param_needle, self._span_xpath)
+        return [self._parse_angle(title) for title in titles]
+
+    def js_args(self) -> dict | None:
+        return {'param': self._param, 'needle': self._param_needle,
+                'spanXpath': self._span_xpath}
 
+    def parse_payload(self, payload: list) -> list:
+        if not self._param:
+            self.logger.warning("Missing 'param' in config for angle extraction.")
+            return []
+        return [self._parse_angle(title) for title in payload]
 
+    def _parse_angle(self, title_attribute):
+        if not title_attribute:
+            return None
+        match = _ANGLE_RE.search(title_attribute)
+        if not match:
+            self.logger.warning("Could not extract angle from title: %s", title_attribute)
+            return None
+        return int(match.group(1))
+
+
+@ExtractionStrategyFactory.register('multi_div_text')
 class MultiDivTextStrategy(ExtractionStrategy):
+    __slots__ = ()
+
+    js_method = 'divs'
+
+    # Evaluates the configured XPath against every cell in-browser and
+    # returns one list of trimmed texts (or nulls) per cell.
+    _DIV_TEXTS_JS = """
+        const xpath = arguments[1];
+        return arguments[0].map(function (cell) {
+            const found = document.evaluate(
+                xpath, cell, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const out = [];
+            for (let i = 0; i < found.snapshotLength; i++) {
+                const text = found.snapshotItem(i).textContent.trim();
+                out.push(text && text !== '\\u00a0' ? text : null);
+            }
+            return out;
+        });
+    """
+
     def extract(self, cells: list[WebElement]) -> list:
         div_selector = self.config_item.get('div_selector')
-        extracted_data = []
-        if div_selector:
-            for cell in cells:
-                divs = cell.find_elements(By.XPATH, div_selector)
-                cloud_values = []
-                for div in divs:
-                    text = div.text.strip()
-                    if text and text != '\xa0':
-                        cloud_values.append(text)
-                    else:
-                        cloud_values.append(None)
-                extracted_data.append("\n".join(map(str, cloud_values)))
-        else:
-            self.logger.warning(f"Missing 'div_selector' in config.")
-            extracted_data = [cell.text.strip() for cell in cells]
-        return extracted_data
-    
+        if not div_selector:
+            self.logger.warning("Missing 'div_selector' in config.")
+            return _bulk_text_content(cells)
+        if not cells:
+            return []
+        # One execute_script round-trip instead of a find_elements plus one
+        # text read per div for every cell.
+        driver = cells[0].parent
+        # Returned as one list of texts (None for empty divs) per cell; the
+        # formatter consumes the lists directly, without a string round-trip.
+        return driver.execute_script(self._DIV_TEXTS_JS, cells, div_selector)
+
+    def js_args(self) -> dict | None:
+        # Without a selector the collection script falls back to plain text.
+        return {'xpath': self.config_item.get('div_selector')}
+
+@ExtractionStrategyFactory.register('regex')
 class RegexContentStrategy(ExtractionStrategy):
-    def extract(self, cells: list[WebElement]) -> list:
-        pattern = self.config_item.get('pattern')
-        group_names = self.config_item.get('group_names')
-        extracted_data = []
+    __slots__ = ()
+
+    def __init__(self, config_item, logger):
+        super().__init__(config_item, logger)
+        pattern = config_item.get('pattern')
         if pattern:
-            for cell in cells:
-                text = cell.text.strip()
-                match = re.search(pattern, text)
-                if match:
-                    if group_names:
-                        extracted_data.append(dict(zip(group_names, match.groups())))
-                    elif match.groups():
-                        extracted_data.append(match.groups() if len(match.groups()) > 1 else match.group(1))
-                    else:
-                        extracted_data.append(match.group(0))  # Return the whole match if no groups
-                else:
-                    extracted_data.append(None)
+            self._pattern = re.compile(pattern)
         else:
-            self.logger.warning(f"Missing 'pattern' in config for regex extraction.")
-            extracted_data = [None] * len(cells)
-        return extracted_data
+            self.logger.warning("Missing 'pattern' in config for regex extraction.")
+            self._pattern = None
+        self._group_names = config_item.get('group_names')
 
+    def extract(self, cells: list[WebElement]) -> list:
+        if not self._pattern:
+            return [None] * len(cells)
+        return self.parse_payload(_bulk_text_content(cells))
+
+    def parse_payload(self, payload: list) -> list:
+        if not self._pattern:
+            return [None] * len(payload)
+        return [self._match_one(text) for text in payload]
+
+    def _match_one(self, text: str):
+        match = self._pattern.search(text)
+        if not match:
+            return None
+        if self._group_names:
+            return dict(zip(self._group_names, match.groups()))
+        if match.groups():
+            return match.groups() if len(match.groups()) > 1 else match.group(1)
+        return match.group(0)  # Return the whole match if no groups
+
+@ExtractionStrategyFactory.register('tide_combined')
 class TideCombinedStrategy(ExtractionStrategy):
+    __slots__ = ()
+
+    js_method = 'svg'
+
+    # Collects [x, y, text] for every SVG text element of every cell in one
+    # in-browser pass ('text' in CSS matches the SVG local name).
+    _SVG_TEXTS_JS = """
+        return arguments[0].map(function (cell) {
+            return Array.from(cell.querySelectorAll('text'), function (el) {
+                return [parseInt(el.getAttribute('x'), 10),
+                        el.getAttribute('y'),
+                        el.textContent];
+            });
+        });
+    """
+
+    def __init__(self, config_item, logger):
+        super().__init__(config_item, logger)
+        self._pattern = re.compile(config_item.get('pattern', r'(\d{2}:\d{2})'))
+        self._threshold = config_item.get('threshold', 5)
+
     def extract(self, cells: list[WebElement]) -> list:
-        pattern = self.config_item.get('pattern', r'(\d{2}:\d{2})')
-        threshold = self.config_item.get('threshold', 5)
-        extracted_data = []
-        
-        for cell in cells:
-            # Find all SVG text elements in the cell
-            text_elements = cell.find_elements(By.XPATH, ".//*[local-name()='text']")
-            # Sort by X position for chronological order
-            sorted_texts = sorted(text_elements, key=lambda e: int(e.get_attribute('x')))
-            
-            tides = []
-            for elem in sorted_texts:
-                time_match = re.search(pattern, elem.text)
-                if time_match:
-                    y = elem.get_attribute('y')
-                    tide_type = 'low' if (y and int(y) > threshold) else 'high'
-                    tides.append({
-                        'time': time_match.group(1),
-                        'type': tide_type
-                    })
-            extracted_data.append(tides)
-        
-        return extracted_data
\ No newline at end of file
+        if not cells:
+            return []
+        # One execute_script round-trip instead of two get_attribute calls
+        # plus one text read per SVG element per cell.
+        driver = cells[0].parent
+        per_cell_entries = driver.execute_script(self._SVG_TEXTS_JS, cells)
+        return self.parse_payload(per_cell_entries)
+
+    def parse_payload(self, payload: list) -> list:
+        return [self._extract_one(entries) for entries in payload]
+
+    def _extract_one(self, entries: list) -> list:
+        # Sort by X position for chronological order
+        entries.sort(key=lambda entry: entry[0])
+
+        tides = []
+        for _, y, text in entries:
+            time_match = self._pattern.search(text)
+            if time_match:
+                tide_type = 'low' if (y and int(y) > self._threshold) else 'high'
+                tides.append({
+                    'time': time_match.group(1),
+                    'type': tide_type
+                })
+        return tides
\ No newline at end of file
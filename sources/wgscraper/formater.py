@@ -1,4 +1,8 @@
 import logging
+import re
+
+# Matches raw date cells like "Sa\n5.\n08h" in a single scan.
+_DATE_HOUR_RE = re.compile(r'(\S+)\n(\d+)\.?\s*\n(\d+)h?')
 
 class ForecastFormatter:
     """
@@ -9,39 +13,34 @@ class ForecastFormatter:
         self.logger = logger or logging.getLogger(__name__)
 
     def _parse_date_hour(self, date_str):
-        parts = date_str.split('\n')
-        if len(parts) == 3:
-            day_abbr, day_num_part, hour_part = parts
-            day_str = day_num_part.replace('.', '').strip()
-            hour_str = hour_part.replace('h', '').strip()
-            return f"{day_abbr}-{day_str}-{hour_str}"
-        else:
-            self.logger.warning(f"Could not parse date string: {date_str}")
-            return None
+        match = _DATE_HOUR_RE.match(date_str)
+        if match:
+            return f"{match[1]}-{match[2]}-{match[3]}"
+        self.logger.warning("Could not parse date string: %s", date_str)
+        return None
+
+    def _parse_cloud_cover(self, cloud_cover):
+        """Parses the cloud cover values into low, medium, and high percentages.
 
-    def _parse_cloud_cover(self, cloud_cover_str):
-        """Parses the cloud cover string into low, medium, and high percentages."""
-        low = None
-        medium = None
-        high = None
+        Accepts the list of per-layer texts produced by MultiDivTextStrategy
+        (None for empty layers), or the legacy newline-joined string.
+        """
+        if isinstance(cloud_cover, str):
+            cloud_cover = cloud_cover.splitlines()
 
-        if isinstance(cloud_cover_str, str):
-            parts = [p.strip() for p in cloud_cover_str.split('\n')]
-            parsed_parts = []
-            for part in parts:
-                if part.isdigit():
+        parsed_parts = []
+        if cloud_cover:
+            for part in cloud_cover:
+                part = part.strip() if isinstance(part, str) else part
+                if isinstance(part, int) or (part and part.isdigit()):
                     parsed_parts.append(int(part))
-                elif part.lower() == 'none':
-                    parsed_parts.append(None)
                 else:
-                    self.logger.warning(f"Could not parse cloud cover part: '{part}'")
+                    if part and part.lower() != 'none':
+                        self.logger.warning("Could not parse cloud cover part: '%s'", part)
                     parsed_parts.append(None)
 
-            if parsed_parts:
-                high = parsed_parts[0] if len(parsed_parts) > 0 else None
-                medium = parsed_parts[1] if len(parsed_parts) > 1 else None
-                low = parsed_parts[2] if len(parsed_parts) > 2 else None
-
+        # The raw cell lists high, medium then low cover; pad missing parts.
+        high, medium, low, *_ = parsed_parts + [None, None, None]
         return {'low_cloud_cover': low, 'medium_cloud_cover': medium, 'high_cloud_cover': high}
     
     def _parse_tide_info(self, tide_info, date_info):
@@ -76,15 +75,15 @@ class ForecastFormatter:
         for model_name, model_forecast in models_data.items():
             model_config = config.get('models').get(model_name)
             if not model_config or 'columns' not in model_config:
-                self.logger.warning(f"No valid configuration found for model: {model_name}")
+                self.logger.warning("No valid configuration found for model: %s", model_name)
                 continue
 
             columns_config = model_config['columns']
 
-            self.logger.info(f"Processing forecast data for model: {model_name}")
+            self.logger.info("Processing forecast data for model: %s", model_name)
             dates = model_forecast.get('date_info')
             if not dates:
-                self.logger.warning(f"No date information found for model: {model_name}")
+                self.logger.warning("No date information found for model: %s", model_name)
                 continue
             if "tide_info" in model_forecast.keys():
                 tide_info = model_forecast.pop("tide_info")
@@ -94,23 +93,34 @@ class ForecastFormatter:
             formatted_data = {}
             num_observations = len(dates)
 
+            # Resolve output names and value lists once per model instead of
+            # re-walking the config and model dicts for every observation.
+            columns = [
+                (
+                    item_name,
+                    columns_config[item_name].get('column_name', item_name),
+                    model_forecast[item_name],
+                    len(model_forecast[item_name]),
+                )
+                for item_name in columns_config
+                if item_name != 'date_info' and item_name in model_forecast
+            ]
+
             for i in range(num_observations):
                 date_hour_str = self._parse_date_hour(dates[i])
                 if date_hour_str:
                     forecast_at_time = {}
-                    for item_name in columns_config:
-                        if item_name != 'date_info':
-                            column_name = columns_config.get('column_name', item_name)
-                            if item_name in models_data[model_name] and len(models_data[model_name] [item_name]) > i:
-                                value = models_data[model_name] [item_name][i]
-                                if item_name == 'cloud_cover':
-                                    cloud_data = self._parse_cloud_cover(value)
-                                    forecast_at_time.update(cloud_data)
-                                else:
-                                    forecast_at_time[column_name] = value
+                    for item_name, column_name, values, num_values in columns:
+                        if i < num_values:
+                            value = values[i]
+                            if item_name == 'cloud_cover':
+                                cloud_data = self._parse_cloud_cover(value)
+                                forecast_at_time.update(cloud_data)
+                            else:
+                                forecast_at_time[column_name] = value
                     formatted_data[date_hour_str] = forecast_at_time
 
             formatted_output['models'][model_name] = formatted_data
-            self.logger.info(f"Forecast data formatted for model: {model_name}")
+            self.logger.info("Forecast data formatted for model: %s", model_name)
 
         return formatted_output
\ No newline at end of file
@@ -1,5 +1,7 @@
 import logging
 
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
 class LoggerManager:
     """
     A dedicated class for managing logging.
@@ -8,16 +10,16 @@ class LoggerManager:
         self.logger = logging.getLogger(logger_name or __name__)
         self.logger.setLevel(logging.INFO)
 
-        # Create a console handler and set its level
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.INFO)
-
-        # Create a formatter and add it to the handler
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        ch.setFormatter(formatter)
-
-        # Add the handler to the logger
-        self.logger.addHandler(ch)
+        # Loggers are singletons by name: only attach a handler on first
+        # setup, otherwise every instantiation would fan each record out to
+        # one more handler.
+        if not self.logger.handlers:
+            ch = logging.StreamHandler()
+            ch.setLevel(logging.INFO)
+            ch.setFormatter(_FORMATTER)
+            self.logger.addHandler(ch)
+            # Avoid double emission through the root logger's handlers.
+            self.logger.propagate = False
 
     def get_logger(self):
-        return self.logger
\ No newline at end of file
+        return self.logger
@@ -1,24 +1,143 @@
+import asyncio
+import functools
+import hashlib
 import json
 import os
 import logging
-
-import pandas as pd
+import re
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # optional dependency; stdlib json is the fallback
+    orjson = None
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions
 from selenium.common.exceptions import TimeoutException
 
-from .webdrivers import InitWebDriver
+from .webdrivers import InitWebDriver, WebDriverPool
 from .extraction_strategies import ExtractionStrategyFactory
 from .formater import ForecastFormatter
 from .loggermanager import LoggerManager
 
+# Extracts the raw payload of every configured column in one in-browser pass:
+# {item: {rowId, xpath, css, method, args}} in, {item: payload or null} out.
+# The method selects the payload shape the matching strategy's parse_payload
+# expects: 'text' (trimmed cell texts), 'titles' (direction span titles),
+# 'divs' (per-cell div texts) or 'svg' (per-cell [x, y, text] triples).
+_COLLECT_TABLE_JS = """
+    const spec = arguments[0];
+    const result = {};
+    const collectCells = function (row, opts) {
+        if (opts.css) { return Array.from(row.querySelectorAll(opts.css)); }
+        const found = document.evaluate(
+            opts.xpath, row, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const cells = [];
+        for (let i = 0; i < found.snapshotLength; i++) {
+            cells.push(found.snapshotItem(i));
+        }
+        return cells;
+    };
+    const spanTitle = function (cell, args) {
+        const dataX = cell.getAttribute('data-x');
+        if (!dataX) { return null; }
+        // Cheap substring check first; fall back to a full JSON parse
+        // only when the needle is absent (e.g. different spacing).
+        if (dataX.indexOf(args.needle) === -1) {
+            try {
+                if (JSON.parse(dataX).param !== args.param) { return null; }
+            } catch (e) {
+                return null;
+            }
+        }
+        const span = document.evaluate(
+            args.spanXpath, cell, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        return span ? span.getAttribute('title') : null;
+    };
+    const divTexts = function (cell, xpath) {
+        const found = document.evaluate(
+            xpath, cell, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const out = [];
+        for (let i = 0; i < found.snapshotLength; i++) {
+            const text = found.snapshotItem(i).textContent.trim();
+            out.push(text && text !== '\\u00a0' ? text : null);
+        }
+        return out;
+    };
+    const svgTexts = function (cell) {
+        return Array.from(cell.querySelectorAll('text'), function (el) {
+            return [parseInt(el.getAttribute('x'), 10),
+                    el.getAttribute('y'),
+                    el.textContent];
+        });
+    };
+    for (const [item, opts] of Object.entries(spec)) {
+        const row = document.getElementById(opts.rowId);
+        if (!row) { result[item] = null; continue; }
+        const cells = collectCells(row, opts);
+        const args = opts.args || {};
+        if (opts.method === 'titles') {
+            result[item] = cells.map(function (c) { return spanTitle(c, args); });
+        } else if (opts.method === 'divs' && args.xpath) {
+            result[item] = cells.map(function (c) { return divTexts(c, args.xpath); });
+        } else if (opts.method === 'svg') {
+            result[item] = cells.map(svgTexts);
+        } else {
+            // innerText keeps the line breaks of rendered text (the date
+            // cells need them); textContent would run the fragments together.
+            result[item] = cells.map(function (c) { return c.innerText.trim(); });
+        }
+    }
+    return result;
+"""
+
+# Resolves as soon as the element with the given id exists, watching the DOM
+# with a MutationObserver; times out via the driver's script timeout.
+_WAIT_FOR_ELEMENT_JS = """
+    const elementId = arguments[0];
+    const done = arguments[arguments.length - 1];
+    if (document.getElementById(elementId)) { done(true); return; }
+    new MutationObserver(function (mutations, observer) {
+        if (document.getElementById(elementId)) {
+            observer.disconnect();
+            done(true);
+        }
+    }).observe(document, {childList: true, subtree: true});
+"""
+
+# CSS equivalents for the cell XPaths used in the shipped config. CSS
+# selectors are matched natively by the rendering engine, whereas XPath goes
+# through document.evaluate; unknown selectors keep the XPath fallback.
+_XPATH_CLASS_RE = re.compile(r"^\.//(\w+)\[contains\(@class, '([\w-]+)'\)\]$")
+
+
+def _xpath_to_css(xpath):
+    if xpath == ".//td":
+        return "td"
+    match = _XPATH_CLASS_RE.match(xpath)
+    if match:
+        # [class*=...] keeps XPath contains() substring semantics; a .class
+        # selector would only match whole class tokens.
+        return f"{match.group(1)}[class*='{match.group(2)}']"
+    return None
+
+# Flattened, validated views of the config, built once per ScraperWg so the
+# hot path never re-walks nested dicts. ModelSpec.cells_spec is the ready
+# argument for _COLLECT_TABLE_JS.
+ModelSpec = namedtuple('ModelSpec', 'name table_id columns cells_spec')
+ColSpec = namedtuple('ColSpec', 'item_name full_id options strategy')
+MainSpec = namedtuple('MainSpec', 'item_name location_type location_value strategy')
+
 class WindguruMetadata:
     """
     A class to hold metadata about the Windguru forecast data.
     """
-    column_metadata = {
+    _column_metadata = {
         "wind_const_speed": {"description": "Average wind speed", "unit": "knots (kn)"},
         "gust_speed": {"description": "Maximum instantaneous wind speed (gust)", "unit": "knots (kn)"},
         "wind_dir": {"description": "Wind direction (meteorological convention)", "unit": "degrees (°)"},
@@ -32,12 +151,22 @@ class WindguruMetadata:
         "precipitation": {"description": "Precipitation amount", "unit": "millimeters (mm)"},
     }
 
+    # Read-only view so callers cannot mutate the shared class dict.
+    column_metadata = MappingProxyType(_column_metadata)
+
     source_url = "https://www.windguru.cz/"
 
     datetime_format_explanation = (
         "The keys in the 'forecast' section represent the forecast time. "
         "The format is: 'DayAbbreviation-DayOfMonth-HourOfDayIn24hFormat' (e.g., 'Sa-5-08' for Saturday, the 5th of the month, at 08:00)."
     )
+
+    # Static part of the print_forecast payload, built once at class
+    # definition instead of per call (plain dict so json can encode it).
+    payload_fragment = {
+        "column_metadata": _column_metadata,
+        "datetime_format": datetime_format_explanation,
+    }
 class ScraperWg:
     """
     A simplified scraper class focused on the 'wg_model' table.
@@ -49,7 +178,9 @@ class ScraperWg:
         station_number=53,
         browser="chrome",
         headless_browser = True,
-        logger=None
+        logger=None,
+        driver_pool=None,
+        cache_ttl=3600
             ):
 
         self.station_number = station_number
@@ -58,14 +189,40 @@ class ScraperWg:
 
         self.config = self._load_config(config_path)
 
-        self.driver= InitWebDriver(browser=browser, logger=self.logger, url=url, headless=headless_browser)()
+        # Windguru forecasts only refresh every few hours; raw scrapes are
+        # cached on disk for cache_ttl seconds (None or 0 disables caching).
+        self.cache_ttl = cache_ttl
+        self._cache_dir = Path(tempfile.gettempdir()) / "wgscraper"
+
+        # When a WebDriverPool is supplied, drivers are leased per scrape
+        # instead of paying a browser cold start per ScraperWg instance.
+        # Without a pool, the browser is only started on the first scrape,
+        # so constructing a ScraperWg stays free of blocking I/O.
+        self.driver_pool = driver_pool
+        self._driver = None
+        if driver_pool is not None:
+            self._driver_factory = None
+        else:
+            self._driver_factory = InitWebDriver(browser=browser, logger=self.logger, url=url, headless=headless_browser)
         self.strategy_factory = ExtractionStrategyFactory(self.logger)
         self.formatter = ForecastFormatter(self.logger)
         self.metadata = WindguruMetadata()
 
+        # All static decisions (config validation, strategy resolution) are
+        # made once here rather than on every scrape_raw call.
+        self._scrape_plan = self._build_scrape_plan()
+        self._main_page_plan = self._build_main_page_plan()
+
         self._cached_raw_data = {}
         self._cached_formatted_forecast = None
 
+    @property
+    def driver(self):
+        """The instance's own WebDriver, started lazily (pool-less mode only)."""
+        if self._driver is None and self._driver_factory is not None:
+            self._driver = self._driver_factory()
+        return self._driver
+
     def __enter__(self):
         return self
 
@@ -76,11 +233,13 @@ class ScraperWg:
         if self._cached_formatted_forecast:
                 llm_output = {
                     "description": f"Windguru weather and station data from {self.url} with detailed metadata.",
-                    "column_metadata": self.metadata.column_metadata,
-                    "datetime_format": self.metadata.datetime_format_explanation,
+                    **self.metadata.payload_fragment,
                     "data": self._cached_formatted_forecast
                 }
-                print(json.dumps(llm_output, indent=2))
+                if orjson is not None:
+                    print(orjson.dumps(llm_output, option=orjson.OPT_INDENT_2).decode())
+                else:
+                    print(json.dumps(llm_output, indent=2))
 
         else:
             print("No data to print.")
@@ -100,128 +259,239 @@ class ScraperWg:
             return formated_forecast
         return None
 
-    def scrape_raw(self, num_prev=None):
-        self.driver.get(self.url)
+    async def get_formatted_forecast_async(self, num_prev=None):
+        """
+        Async variant of get_formatted_forecast: the blocking Selenium work
+        runs on the default executor, so several stations can be gathered
+        concurrently from one event loop. Use one ScraperWg per concurrent
+        scrape (or a shared WebDriverPool) since drivers are not thread-safe.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_formatted_forecast, num_prev)
+
+    async def scrape_raw_async(self, num_prev=None, force_refresh=False):
+        """Async wrapper around scrape_raw (see get_formatted_forecast_async)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.scrape_raw, num_prev=num_prev, force_refresh=force_refresh))
+
+    def scrape_raw(self, num_prev=None, force_refresh=False):
+        cache_path = self._cache_path(num_prev)
+        if not force_refresh and self.cache_ttl:
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                self._cached_raw_data = cached
+                return cached
+
+        if self.driver_pool is not None:
+            with self.driver_pool.lease() as driver:
+                raw_data = self._scrape_raw_with(driver, num_prev)
+        else:
+            raw_data = self._scrape_raw_with(self.driver, num_prev)
+
+        # Only cache scrapes that actually produced data; persisting an empty
+        # result (e.g. after a page-load hiccup) would negatively cache the
+        # failure for cache_ttl seconds instead of retrying on the next call.
+        if self.cache_ttl and self._has_model_data(raw_data):
+            self._write_cache(cache_path, raw_data)
+        return raw_data
+
+    @staticmethod
+    def _has_model_data(raw_data):
+        return any(
+            values
+            for model_data in raw_data.get('models', {}).values()
+            for values in model_data.values()
+        )
+
+    def _cache_path(self, num_prev):
+        key_source = f"{self.station_number}:{num_prev}:" + json.dumps(self.config, sort_keys=True)
+        key = hashlib.sha1(key_source.encode()).hexdigest()
+        return self._cache_dir / f"{key}.json"
+
+    def _read_cache(self, cache_path):
+        try:
+            if time.time() - cache_path.stat().st_mtime < self.cache_ttl:
+                with open(cache_path, 'r') as f:
+                    raw_data = json.load(f)
+                self.logger.info("Returning cached raw data from: %s", cache_path)
+                return raw_data
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning("Ignoring unreadable cache file '%s': %s", cache_path, e)
+        return None
+
+    def _write_cache(self, cache_path, raw_data):
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w') as f:
+                json.dump(raw_data, f)
+        except (OSError, TypeError) as e:
+            self.logger.warning("Could not write cache file '%s': %s", cache_path, e)
+
+    def _build_scrape_plan(self):
+        """
+        Walks the 'models' config once, validating it and resolving the
+        extraction strategy of every column up front.
+        Returns:
+            list: one ModelSpec per valid model, with a ColSpec per column.
+        """
+        plan = []
+        models_config = self.config.get('models', {})
+        for model_name, model_config in models_config.items():
+            if model_config.get('type') != 'table':
+                self.logger.warning("No configuration found or it's not of type 'table' for model '%s'.", model_name)
+                continue
+            location_config = model_config.get('location')
+            if not (location_config and location_config.get('type') == 'id' and location_config.get('value')):
+                self.logger.warning("Invalid or missing 'location' configuration for model '%s'.", model_name)
+                continue
+
+            table_id = location_config['value']
+            columns = []
+            for item_name, column_options in model_config.get('columns', {}).items():
+                element_id_suffix = column_options.get('element_id_suffix')
+                if not element_id_suffix:
+                    self.logger.warning("Skipping column '%s': missing 'element_id_suffix'.", item_name)
+                    continue
+                extraction_method_name = column_options.get('extraction_method')
+                strategy = self.strategy_factory.get_strategy(extraction_method_name, column_options)
+                columns.append(ColSpec(item_name, table_id + element_id_suffix, column_options, strategy))
+            cells_spec = {}
+            for col in columns:
+                cell_xpath = col.options.get('cell_selector', ".//td") # Default to all td elements
+                cells_spec[col.item_name] = {
+                    'rowId': col.full_id,
+                    'xpath': cell_xpath,
+                    'css': _xpath_to_css(cell_xpath),
+                    'method': col.strategy.js_method if col.strategy else 'text',
+                    'args': col.strategy.js_args() if col.strategy else None,
+                }
+            plan.append(ModelSpec(model_name, table_id, columns, cells_spec))
+        return plan
+
+    def _build_main_page_plan(self):
+        """
+        Walks the 'main_page_data' config once and resolves each item into a
+        validated MainSpec with its extraction strategy.
+        """
+        specs = []
+        for item_name, item_config in self.config.get('main_page_data', {}).items():
+            location_config = item_config.get('location')
+            extraction_config = item_config.get('extraction')
+            if not (location_config and location_config.get('type') and location_config.get('value')
+                    and extraction_config and extraction_config.get('method')):
+                self.logger.warning("Invalid or missing configuration for main page item '%s'.", item_name)
+                continue
+            location_type = location_config['type']
+            if location_type not in ('css_selector', 'xpath'):
+                self.logger.warning("Unsupported location type '%s' for '%s'.", location_type, item_name)
+                continue
+            strategy = self.strategy_factory.get_strategy(extraction_config['method'], extraction_config)
+            if not strategy:
+                self.logger.warning("No valid extraction strategy found for '%s'.", item_name)
+                continue
+            specs.append(MainSpec(item_name, location_type, location_config['value'], strategy))
+        return specs
+
+    def _scrape_raw_with(self, driver, num_prev):
+        driver.get(self.url)
         self.logger.info("Starting raw data scraping...")
-        self._wait_for_page_load()
+        self._wait_for_page_load(driver)
 
         raw_data = {"models": {}, "main_page_info": {}}
+        limit = self._resolve_limit(num_prev)
 
         # Scrape models data
-        models_config = self.config.get('models', {})
-        for model_name, model_config in models_config.items():
-            if model_config.get('type') == 'table':
-                location_config = model_config.get('location')
-                columns_config = model_config.get('columns', {})
-
-                if location_config and location_config.get('type') == 'id' and location_config.get('value'):
-                    table_id = location_config.get('value')
-                    self.logger.info(f"Scraping raw data for model '{model_name}' from table ID '{table_id}'...")
-                    raw_data['models'][model_name] = self._extract_from_table(self.driver, table_id, columns_config, num_prev)
-                    self.logger.info(f"Raw data scraping complete for model '{model_name}'.")
-                else:
-                    self.logger.warning(f"Invalid or missing 'location' configuration for model '{model_name}'.")
-            else:
-                self.logger.warning(f"No configuration found or it's not of type 'table' for model '{model_name}'.")
+        for model in self._scrape_plan:
+            self.logger.info("Scraping raw data for model '%s' from table ID '%s'...", model.name, model.table_id)
+            raw_data['models'][model.name] = self._extract_from_table(driver, model, limit)
+            self.logger.info("Raw data scraping complete for model '%s'.", model.name)
 
         # Scrape main page information
-        main_page_config = self.config.get('main_page_data', {})
-        if main_page_config:
+        if self._main_page_plan:
             self.logger.info("Scraping main page information using external method...")
-            raw_data['main_page_info'] = self._extract_main_page_info(self.driver, main_page_config)
+            raw_data['main_page_info'] = self._extract_main_page_info(driver)
             self.logger.info("Main page information scraping complete.")
 
         self._cached_raw_data = raw_data
         return raw_data
 
-    def _extract_from_table(self, driver, table_id, columns_config, num_prev):
-        table_data = {}
-        for item_name, column_options in columns_config.items():
-            element_id_suffix = column_options.get('element_id_suffix')
-            cell_selector = column_options.get('cell_selector', ".//td") # Default to all td elements
+    def _extract_from_table(self, driver, model, limit):
+        # One execute_script round-trip returns the raw payload of every
+        # column (texts, titles, div texts or SVG entries, per the plan spec);
+        # the strategies then parse those payloads without touching the wire.
+        # A script failure (e.g. a malformed selector in the user-edited
+        # config) degrades to empty columns, like per-column errors below.
+        try:
+            payloads = driver.execute_script(_COLLECT_TABLE_JS, model.cells_spec)
+        except Exception as e:
+            self.logger.warning("Error collecting table data for model '%s': %s", model.name, e)
+            return {col.item_name: [] for col in model.columns}
 
-            if element_id_suffix:
-                try:
-                    row = driver.find_element(By.ID, table_id + element_id_suffix)
-                    cells = row.find_elements(By.XPATH, cell_selector)
-                    extraction_method_name = column_options.get('extraction_method')
-                    strategy = self.strategy_factory.get_strategy(extraction_method_name, column_options)
-                    if strategy:
-                        table_data[item_name] = self._limit_observations(strategy.extract(cells), num_prev, item_name)
-                    else:
-                        self.logger.warning(f"No extraction strategy found for method: {extraction_method_name}")
-                        table_data[item_name] = self._limit_observations([cell.text.strip() for cell in cells], num_prev, item_name)
-                    self.logger.info(f"Raw data scraped for column '{item_name}'.")
-                except Exception as e:
-                    self.logger.warning(f"Error during raw data extraction for column '{item_name}': {e}")
-                    table_data[item_name] = []
-            else:
-                self.logger.warning(f"Skipping column '{item_name}': missing 'element_id_suffix'.")
+        table_data = {}
+        for col in model.columns:
+            payload = payloads.get(col.item_name)
+            if payload is None:
+                self.logger.warning("Row not found for column '%s' (ID '%s').", col.item_name, col.full_id)
+                table_data[col.item_name] = []
+                continue
+            try:
+                values = col.strategy.parse_payload(payload) if col.strategy else payload
+                table_data[col.item_name] = values[:limit] if limit is not None else values
+                self.logger.debug("Raw data scraped for column '%s'.", col.item_name)
+            except Exception as e:
+                self.logger.warning("Error during raw data extraction for column '%s': %s", col.item_name, e)
+                table_data[col.item_name] = []
         return table_data
     
-    def _extract_main_page_info(self, driver, main_page_config):
+    def _extract_main_page_info(self, driver):
         extracted_data = {}
 
-        for item_name, item_config in main_page_config.items():
-            location_config = item_config.get('location')
-            extraction_config = item_config.get('extraction')
-
-            if location_config and location_config.get('type') and location_config.get('value') and extraction_config and extraction_config.get('method'):
-                location_type = location_config['type']
-                location_value = location_config['value']
-                extraction_method = extraction_config['method']
-
-                element = None
-                try:
-                    if location_type == 'css_selector':
-                        element = driver.find_element(By.CSS_SELECTOR, location_value)
-                    elif location_type == 'xpath':
-                        element = driver.find_element(By.XPATH, location_value)
-                    else:
-                        self.logger.warning(f"Unsupported location type '{location_type}' for '{item_name}'.")
-                        continue
-
-                    if element:
-                        strategy = self.strategy_factory.get_strategy(extraction_method, extraction_config)
-                        if strategy:
-                            # For single element extraction, we'll treat it as a list of one
-                            extracted_value = strategy.extract([element])
-                            if extracted_value:
-                                extracted_data[item_name] = extracted_value[0] if len(extracted_value) == 1 else extracted_value
-                                self.logger.info(f"Extracted '{item_name}': {extracted_data[item_name]}")
-                            else:
-                                self.logger.warning(f"Extraction strategy returned empty result for '{item_name}'.")
-                        else:
-                            self.logger.warning(f"No valid extraction strategy found for '{item_name}'.")
-
-                except Exception as e:
-                    self.logger.error(f"An error occurred while extracting '{item_name}': {e}")
-            else:
-                self.logger.warning(f"Invalid or missing configuration for main page item '{item_name}'.")
+        for spec in self._main_page_plan:
+            try:
+                by = By.CSS_SELECTOR if spec.location_type == 'css_selector' else By.XPATH
+                element = driver.find_element(by, spec.location_value)
+
+                # For single element extraction, we'll treat it as a list of one
+                extracted_value = spec.strategy.extract([element])
+                if extracted_value:
+                    extracted_data[spec.item_name] = extracted_value[0] if len(extracted_value) == 1 else extracted_value
+                    self.logger.debug("Extracted '%s': %s", spec.item_name, extracted_data[spec.item_name])
+                else:
+                    self.logger.warning("Extraction strategy returned empty result for '%s'.", spec.item_name)
+            except Exception as e:
+                self.logger.error("An error occurred while extracting '%s': %s", spec.item_name, e)
         return extracted_data
 
     def close_driver(self):
-        if self.driver:
+        # Checks _driver directly so closing never triggers a lazy start;
+        # the next scrape restarts the browser from the kept factory.
+        if self._driver:
             try:
-                self.driver.quit()
+                self._driver.quit()
                 self.logger.info("WebDriver closed.")
-                self.driver = None
+                self._driver = None
             except Exception as e:
-                self.logger.error(f"Error closing WebDriver: {e}")
+                self.logger.error("Error closing WebDriver: %s", e)
 
-    def _limit_observations(self, raw_data, num_prev, item_name):
+    def _resolve_limit(self, num_prev):
+        # Decided once per scrape instead of once per column.
         if num_prev is not None:
             try:
-                return raw_data[:int(num_prev)]
+                return int(num_prev)
             except (ValueError, TypeError):
-                self.logger.warning(f"Invalid 'num_prev' value: '{num_prev}'. Using all available data for '{item_name}'.")
-        return raw_data
+                self.logger.warning("Invalid 'num_prev' value: '%s'. Using all available data.", num_prev)
+        return None
 
-    def _wait_for_page_load(self):
+    def _wait_for_page_load(self, driver):
         try:
-            WebDriverWait(self.driver, 10).until(
-                expected_conditions.presence_of_element_located((By.ID, 'tabid_0_0_dates'))
-            )
+            # A MutationObserver inside one execute_async_script call fires
+            # the moment the forecast table appears, instead of WebDriverWait
+            # re-issuing a find_element over the wire every poll interval.
+            driver.set_script_timeout(10)
+            driver.execute_async_script(_WAIT_FOR_ELEMENT_JS, 'tabid_0_0_dates')
             self.logger.debug("Page loaded successfully.")
             return True
         except TimeoutException:
@@ -230,16 +500,85 @@ class ScraperWg:
 
     def _load_config(self, config_path="config.json"):
         try:
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
-            self.logger.info(f"Configuration loaded successfully from: {config_path}")
+            # Memoized on (path, mtime): batch scrapes with the same config
+            # parse it once. The returned dict is shared and treated as
+            # read-only by the scraper and the strategies.
+            config_data = _load_config_cached(config_path, os.path.getmtime(config_path))
+            self.logger.info("Configuration loaded successfully from: %s", config_path)
             return config_data
         except FileNotFoundError:
-            self.logger.error(f"Configuration file not found at: {config_path}")
+            self.logger.error("Configuration file not found at: %s", config_path)
             return {}
         except json.JSONDecodeError as e:
-            self.logger.error(f"Error parsing JSON configuration file '{config_path}': {e}")
+            self.logger.error("Error parsing JSON configuration file '%s': %s", config_path, e)
             raise ValueError(f"Failed to parse config file: {config_path}") from e
         except Exception as e:
-            self.logger.error(f"An unexpected error occurred while loading configuration from '{config_path}': {e}")
-            raise ValueError(f"Failed to load config file: {config_path}") from e
\ No newline at end of file
+            self.logger.error("An unexpected error occurred while loading configuration from '%s': %s", config_path, e)
+            raise ValueError(f"Failed to load config file: {config_path}") from e
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(config_path, mtime):
+    # orjson parses the raw bytes several times faster than stdlib json;
+    # its JSONDecodeError subclasses the stdlib one, so callers need not care.
+    with open(config_path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _scrape_one(station_number, config_path, url, num_prev, pool, logger):
+    scraper = ScraperWg(
+        config_path=config_path,
+        url=url,
+        station_number=station_number,
+        logger=logger,
+        driver_pool=pool,
+    )
+    return scraper.get_formatted_forecast(num_prev=num_prev)
+
+
+def scrape_many(
+    station_numbers,
+    config_path='../../scraping_config.json',
+    url='https://www.windguru.cz/',
+    num_prev=None,
+    workers=4,
+    browser="chrome",
+    headless_browser=True,
+    logger=None,
+    remote_url=None,
+):
+    """
+    Scrapes several stations in parallel over a shared WebDriverPool.
+    Args:
+        station_numbers (list): Windguru station numbers to scrape.
+        workers (int): Number of pooled drivers / concurrent scrapes.
+        remote_url (str): Optional Selenium Grid URL; drivers are created
+            there instead of starting local browsers.
+    Returns:
+        dict: Formatted forecast (or None on failure) per station number.
+    """
+    logger = logger or LoggerManager().get_logger()
+    workers = min(workers, len(station_numbers)) or 1
+    pool = WebDriverPool(size=workers, browser=browser, headless=headless_browser,
+                         logger=logger, remote_url=remote_url)
+
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _scrape_one, station, config_path, url, num_prev, pool, logger): station
+                for station in station_numbers
+            }
+            for future in as_completed(futures):
+                station = futures[future]
+                try:
+                    results[station] = future.result()
+                except Exception as e:
+                    logger.error("Scraping failed for station %s: %s", station, e)
+                    results[station] = None
+    finally:
+        pool.shutdown()
+    return results
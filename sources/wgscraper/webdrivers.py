@@ -1,104 +1,231 @@
+import functools
 import logging
+import queue
 import tempfile
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.safari.options import Options as SafariOptions
-
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.firefox import GeckoDriverManager
-from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from contextlib import contextmanager
+
+# The selenium and webdriver_manager modules for each browser are imported
+# lazily inside the matching InitWebDriver branch, so importing this module
+# (or driving one browser) does not pay for the other three stacks.
+
+
+# webdriver-manager's install() checks the network for driver updates; memoize
+# the resolved path so only the first driver start in a process pays for it.
+@functools.lru_cache(maxsize=None)
+def _chrome_driver_path():
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+@functools.lru_cache(maxsize=None)
+def _gecko_driver_path():
+    from webdriver_manager.firefox import GeckoDriverManager
+    return GeckoDriverManager().install()
+
+
+@functools.lru_cache(maxsize=None)
+def _edge_driver_path():
+    from webdriver_manager.microsoft import EdgeChromiumDriverManager
+    return EdgeChromiumDriverManager().install()
+
 
 class InitWebDriver:
     """
     A dedicated class for managing WebDriver initialization with webdriver-manager fallback.
     """
-    def __init__(self, url, browser="chrome", headless=True, logger=None):
-        self.logger = logger or logging.getLogger
+    def __init__(self, url, browser="chrome", headless=True, logger=None, remote_url=None,
+                 user_data_dir=None):
+        self.logger = logger or logging.getLogger(__name__)
         self.browser = browser.lower()
         self.url = url
         self.headless = headless
-    
+        # When set, drivers are created on a Selenium Grid / remote WebDriver
+        # at this URL instead of starting a local browser.
+        self.remote_url = remote_url
+        # Optional persistent Chrome profile directory so the HTTP disk cache
+        # (windguru's JS bundle, etc.) survives across runs. Chrome refuses to
+        # share one profile between concurrent instances, so leave this unset
+        # when driving several drivers (e.g. through WebDriverPool).
+        self.user_data_dir = user_data_dir
+
+    def _remote(self, options):
+        from selenium import webdriver
+        driver = webdriver.Remote(command_executor=self.remote_url, options=options)
+        self.logger.info("Remote %s WebDriver initialized via %s.", self.browser, self.remote_url)
+        return driver
+
     def __call__(self):
         try:
-            if self.browser == "chrome":
-                chrome_options = ChromeOptions()
-
-                if self.headless:
-                    self.logger.info("Adding --headless=new argument to ChromeOptions.")
-                    chrome_options.add_argument("--headless=new")
-                    self.logger.info("Adding comprehensive stabilization arguments to ChromeOptions.")
-                    chrome_options.add_argument("--no-sandbox")
-                    chrome_options.add_argument("--disable-dev-shm-usage")
-                    chrome_options.add_argument("--disable-extensions")
-                    chrome_options.add_argument("--disable-gpu")
-                    chrome_options.add_argument("--disable-browser-side-navigation")
-                    chrome_options.add_argument("--disable-default-apps")
-                    chrome_options.add_argument("--disable-translate")
-                    chrome_options.add_argument("--disable-background-networking")
-                    chrome_options.add_argument("--disable-sync")
-                    chrome_options.add_argument("--disable-client-side-phishing-detection")
-                    chrome_options.add_argument("--disable-features=site-per-process")
-                    chrome_options.add_argument("--metrics-recording-only")
-                    chrome_options.add_argument("--disable-hang-monitor")
-                    chrome_options.add_argument("--hide-scrollbars")
-                    chrome_options.add_argument("--mute-audio")
-                    chrome_options.add_argument("--no-default-browser-check")
-                    chrome_options.add_argument("--no-first-run")
-                    chrome_options.add_argument("--force-device-scale-factor=1")
-                    chrome_options.add_argument("--disk-cache-dir=/dev/null")
-
-                try:
-                    self.logger.info("Attempting to initialize Chrome WebDriver via webdriver-manager.")
-                    service = ChromeService(ChromeDriverManager().install())
-                    driver = webdriver.Chrome(service=service, options=chrome_options)
-                    self.logger.info(f"Chrome WebDriver initialized via webdriver-manager (headless: {self.headless}).")
-                    return driver
-                except Exception as e:
-                    self.logger.warning(f"webdriver-manager failed for Chrome: {e}. Falling back to local setup.")
-                    self.logger.info("Attempting to initialize Chrome WebDriver using local setup (Selenium Manager).")
-                    driver = webdriver.Chrome(options=chrome_options)
-                    self.logger.info(f"Chrome WebDriver initialized via local setup (headless: {self.headless}).")
-                    return driver
-            elif self.browser == "firefox":
-                firefox_options = FirefoxOptions()
-                if self.headless:
-                    firefox_options.add_argument("-headless")
-                try:
-                    service = FirefoxService(GeckoDriverManager().install())
-                    driver = webdriver.Firefox(service=service, options=firefox_options)
-                    self.logger.info(f"Firefox WebDriver initialized via webdriver-manager (headless: {self.headless}).")
-                    return driver
-                except Exception as e:
-                    self.logger.warning(f"webdriver-manager failed for Firefox: {e}. Falling back to local setup.")
-                    driver = webdriver.Firefox(options=firefox_options)
-                    self.logger.info(f"Firefox WebDriver initialized (headless: {self.headless}).")
-                    return driver
-            elif self.browser == "edge":
-                edge_options = EdgeOptions()
-                if self.headless:
-                    edge_options.add_argument("--headless")
-                try:
-                    service = EdgeService(EdgeChromiumDriverManager().install())
-                    driver = webdriver.Edge(service=service, options=edge_options)
-                    self.logger.info(f"Edge WebDriver initialized via webdriver-manager (headless: {self.headless}).")
-                    return driver
-                except Exception as e:
-                    self.logger.warning(f"webdriver-manager failed for Edge: {e}. Falling back to local setup.")
-                    driver = webdriver.Edge(options=edge_options)
-                    self.logger.info(f"Edge WebDriver initialized (headless: {self.headless}).")
-                    return driver
-            elif self.browser == "safari":
-                safari_options = SafariOptions()
-                driver = webdriver.Safari(options=safari_options)
-                self.logger.info("Safari WebDriver initialized (ensure remote automation is enabled).")
-                return driver
-            else:
+            init = getattr(self, f"_init_{self.browser}", None)
+            if init is None:
                 raise ValueError(f"Unsupported browser: {self.browser}.")
+            return init()
+        except Exception as e:
+            self.logger.error("Error initializing WebDriver: %s", e)
+            raise
+
+    def _build_chrome_options(self):
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+        chrome_options = ChromeOptions()
+
+        # The scraper only reads text nodes and attributes, so skip
+        # images, stylesheets and fonts entirely and stop waiting for
+        # subresources once the DOM is ready.
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+
+        if self.headless:
+            self.logger.info("Adding --headless=new argument to ChromeOptions.")
+            chrome_options.add_argument("--headless=new")
+            self.logger.info("Adding comprehensive stabilization arguments to ChromeOptions.")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--disable-browser-side-navigation")
+            chrome_options.add_argument("--disable-default-apps")
+            chrome_options.add_argument("--disable-translate")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-sync")
+            chrome_options.add_argument("--disable-client-side-phishing-detection")
+            chrome_options.add_argument("--disable-features=site-per-process")
+            chrome_options.add_argument("--metrics-recording-only")
+            chrome_options.add_argument("--disable-hang-monitor")
+            chrome_options.add_argument("--hide-scrollbars")
+            chrome_options.add_argument("--mute-audio")
+            chrome_options.add_argument("--no-default-browser-check")
+            chrome_options.add_argument("--no-first-run")
+            chrome_options.add_argument("--force-device-scale-factor=1")
+            if not self.user_data_dir:
+                chrome_options.add_argument("--disk-cache-dir=/dev/null")
+        if self.user_data_dir:
+            chrome_options.add_argument(f"--user-data-dir={self.user_data_dir}")
+            chrome_options.add_argument("--disk-cache-size=52428800")
+        return chrome_options
+
+    def _init_chrome(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service as ChromeService
+
+        chrome_options = self._build_chrome_options()
+        if self.remote_url:
+            return self._remote(chrome_options)
+        try:
+            self.logger.info("Attempting to initialize Chrome WebDriver via webdriver-manager.")
+            service = ChromeService(_chrome_driver_path())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.logger.info("Chrome WebDriver initialized via webdriver-manager (headless: %s).", self.headless)
+            return driver
+        except Exception as e:
+            self.logger.warning("webdriver-manager failed for Chrome: %s. Falling back to local setup.", e)
+            self.logger.info("Attempting to initialize Chrome WebDriver using local setup (Selenium Manager).")
+            driver = webdriver.Chrome(options=chrome_options)
+            self.logger.info("Chrome WebDriver initialized via local setup (headless: %s).", self.headless)
+            return driver
+
+    def _build_firefox_options(self):
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+        firefox_options = FirefoxOptions()
+        if self.headless:
+            firefox_options.add_argument("-headless")
+        return firefox_options
+
+    def _init_firefox(self):
+        from selenium import webdriver
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+
+        firefox_options = self._build_firefox_options()
+        if self.remote_url:
+            return self._remote(firefox_options)
+        try:
+            service = FirefoxService(_gecko_driver_path())
+            driver = webdriver.Firefox(service=service, options=firefox_options)
+            self.logger.info("Firefox WebDriver initialized via webdriver-manager (headless: %s).", self.headless)
+            return driver
         except Exception as e:
-            self.logger.error(f"Error initializing WebDriver: {e}")
-            raise
\ No newline at end of file
+            self.logger.warning("webdriver-manager failed for Firefox: %s. Falling back to local setup.", e)
+            driver = webdriver.Firefox(options=firefox_options)
+            self.logger.info("Firefox WebDriver initialized (headless: %s).", self.headless)
+            return driver
+
+    def _build_edge_options(self):
+        from selenium.webdriver.edge.options import Options as EdgeOptions
+
+        edge_options = EdgeOptions()
+        if self.headless:
+            edge_options.add_argument("--headless")
+        return edge_options
+
+    def _init_edge(self):
+        from selenium import webdriver
+        from selenium.webdriver.edge.service import Service as EdgeService
+
+        edge_options = self._build_edge_options()
+        if self.remote_url:
+            return self._remote(edge_options)
+        try:
+            service = EdgeService(_edge_driver_path())
+            driver = webdriver.Edge(service=service, options=edge_options)
+            self.logger.info("Edge WebDriver initialized via webdriver-manager (headless: %s).", self.headless)
+            return driver
+        except Exception as e:
+            self.logger.warning("webdriver-manager failed for Edge: %s. Falling back to local setup.", e)
+            driver = webdriver.Edge(options=edge_options)
+            self.logger.info("Edge WebDriver initialized (headless: %s).", self.headless)
+            return driver
+
+    def _init_safari(self):
+        from selenium import webdriver
+        from selenium.webdriver.safari.options import Options as SafariOptions
+
+        safari_options = SafariOptions()
+        driver = webdriver.Safari(options=safari_options)
+        self.logger.info("Safari WebDriver initialized (ensure remote automation is enabled).")
+        return driver
+
+class WebDriverPool:
+    """
+    A small pool of pre-started WebDrivers shared across scrapes, so repeated
+    scrapes do not pay the multi-second browser cold start each time.
+    """
+    def __init__(self, size=2, browser="chrome", headless=True, logger=None, remote_url=None):
+        self.logger = logger or logging.getLogger(__name__)
+        self.size = size
+        self._drivers = queue.Queue()
+        for _ in range(size):
+            driver = InitWebDriver(
+                url=None, browser=browser, headless=headless, logger=self.logger,
+                remote_url=remote_url)()
+            self._drivers.put(driver)
+        self.logger.info("WebDriverPool started with %s driver(s).", size)
+
+    @contextmanager
+    def lease(self):
+        """Yields a driver from the pool and resets it on return."""
+        driver = self._drivers.get()
+        try:
+            yield driver
+        finally:
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except Exception as e:
+                self.logger.warning("Error resetting pooled WebDriver: %s", e)
+            self._drivers.put(driver)
+
+    def shutdown(self):
+        """Quits every driver in the pool."""
+        while not self._drivers.empty():
+            driver = self._drivers.get_nowait()
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.error("Error closing pooled WebDriver: %s", e)
+        self.logger.info("WebDriverPool shut down.")
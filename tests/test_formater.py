@@ -0,0 +1,68 @@
+import pytest
+
+from wgscraper.formater import ForecastFormatter
+
+
+@pytest.fixture
+def config():
+    return {
+        "models": {
+            "wg_model": {
+                "columns": {
+                    "date_info": {"column_name": "date"},
+                    "wind_const_speed": {"column_name": "wind_const_speed"},
+                    "swell_dir": {"column_name": "swell_direction"},
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture
+def raw_forecast():
+    return {
+        "main_page_info": {"sunrise_sunset": {"sunrise": "07:00", "sunset": "21:00"}},
+        "models": {
+            "wg_model": {
+                "date_info": ["Sa\n5.\n08h", "Sa\n5.\n11h"],
+                "wind_const_speed": [10.0, 12.0],
+                "swell_dir": [270, 280],
+            }
+        },
+    }
+
+
+def test_format_forecast_structure(config, raw_forecast):
+    formatted = ForecastFormatter().format_forecast(raw_forecast, config)
+
+    assert formatted["ephemerides"] == raw_forecast["main_page_info"]
+    forecast = formatted["models"]["wg_model"]
+    assert list(forecast) == ["Sa-5-08", "Sa-5-11"]
+    assert forecast["Sa-5-08"]["wind_const_speed"] == 10.0
+
+
+def test_format_forecast_uses_configured_column_name(config, raw_forecast):
+    formatted = ForecastFormatter().format_forecast(raw_forecast, config)
+
+    forecast = formatted["models"]["wg_model"]
+    assert forecast["Sa-5-08"]["swell_direction"] == 270
+    assert "swell_dir" not in forecast["Sa-5-08"]
+
+
+@pytest.mark.parametrize("cloud_cover", [[None, "50", "10"], "None\n50\n10"])
+def test_parse_cloud_cover_accepts_lists_and_strings(cloud_cover):
+    parsed = ForecastFormatter()._parse_cloud_cover(cloud_cover)
+
+    assert parsed == {
+        "low_cloud_cover": 10,
+        "medium_cloud_cover": 50,
+        "high_cloud_cover": None,
+    }
+
+
+def test_format_forecast_handles_short_columns(config, raw_forecast):
+    raw_forecast["models"]["wg_model"]["wind_const_speed"] = [10.0]
+    formatted = ForecastFormatter().format_forecast(raw_forecast, config)
+
+    forecast = formatted["models"]["wg_model"]
+    assert "wind_const_speed" not in forecast["Sa-5-11"]
@@ -0,0 +1,20 @@
+import logging
+
+import pytest
+
+from wgscraper.webdrivers import InitWebDriver
+
+
+def test_default_logger_is_a_logger_instance():
+    init = InitWebDriver(url="https://www.windguru.cz/")
+
+    assert isinstance(init.logger, logging.Logger)
+
+
+def test_unsupported_browser_logs_without_attribute_error():
+    init = InitWebDriver(url="https://www.windguru.cz/", browser="netscape")
+
+    # The error path goes through self.logger.error; with the old
+    # `logging.getLogger` default this raised AttributeError instead.
+    with pytest.raises(ValueError, match="Unsupported browser"):
+        init()